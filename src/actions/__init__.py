@@ -1,41 +1,119 @@
-import importlib
+import functools
+import importlib.util
 import typing as T
 from enum import Enum
+from importlib import import_module as _import
 from typing import Optional
 
 from actions.base import ActionConfig, ActionConnector, AgentAction, Interface
 
+_B = T.TypeVar("_B")
 
-def describe_action(
-    action_name: str, llm_label: str, exclude_from_prompt: bool
-) -> Optional[str]:
+
+@functools.cache
+def _spec_exists(module_name: str) -> bool:
     """
-    Generate a description of the action for use in prompts.
+    Check whether a module can be found without executing it.
+
+    The module itself is not imported, but its parent packages are. Failed
+    lookups are memoized so that repeated attempts to load a missing action
+    do not search the import path again.
 
     Parameters
     ----------
-    action_name : str
-        The name of the action.
-    llm_label : str
-        The label used by the LLM for this action.
-    exclude_from_prompt : bool
-        Whether to exclude this action from the prompt. If True, returns None.
+    module_name : str
+        The fully qualified name of the module.
 
     Returns
     -------
-    Optional[str]
-        A formatted description of the action, or None if excluded.
+    bool
+        True if the module can be found, False otherwise.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If a parent package exists but fails to import one of its own
+        dependencies.
     """
-    if exclude_from_prompt:
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ModuleNotFoundError as e:
+        if e.name is not None and (
+            module_name == e.name or module_name.startswith(f"{e.name}.")
+        ):
+            return False
+        raise
+
+
+@functools.cache
+def _resolve_class(module_name: str, base: type) -> T.Optional[type]:
+    """
+    Import a module once and resolve the class it defines for the given base.
+
+    Parameters
+    ----------
+    module_name : str
+        The fully qualified name of the module to import.
+    base : type
+        The base class to look for in the module.
+
+    Returns
+    -------
+    Optional[type]
+        The last subclass of base found in the module, or None if the module
+        cannot be found or defines no such class.
+    """
+    if not _spec_exists(module_name):
         return None
 
-    interface = None
-    action = importlib.import_module(f"actions.{action_name}.interface")
+    module = _import(module_name)
+
+    resolved = None
+    for _, obj in module.__dict__.items():
+        if isinstance(obj, type) and issubclass(obj, base) and obj != base:
+            resolved = obj
+
+    return resolved
+
+
+def _cached_import(module_name: str, base: T.Type[_B]) -> T.Optional[T.Type[_B]]:
+    """
+    Resolve the subclass of base defined in a module, importing it only once.
+
+    Parameters
+    ----------
+    module_name : str
+        The fully qualified name of the module to import.
+    base : Type[_B]
+        The base class to look for in the module.
+
+    Returns
+    -------
+    Optional[Type[_B]]
+        The last subclass of base found in the module, or None if the module
+        cannot be found or defines no such class.
+    """
+    return T.cast(T.Optional[T.Type[_B]], _resolve_class(module_name, base))
+
+
+@functools.cache
+def _render_description(action_name: str, llm_label: str) -> str:
+    """
+    Render the full prompt description of an action once per label.
 
-    for _, obj in action.__dict__.items():
-        if isinstance(obj, type) and issubclass(obj, Interface) and obj != Interface:
-            interface = obj
+    Parameters
+    ----------
+    action_name : str
+        The name of the action.
+    llm_label : str
+        The label used by the LLM for this action.
 
+    Returns
+    -------
+    str
+        The formatted description of the action.
+    """
+    interface = _cached_import(f"actions.{action_name}.interface", Interface)
     if interface is None:
         raise ValueError(f"No interface found for action {action_name}")
 
@@ -67,6 +145,32 @@ def describe_action(
     return final_description
 
 
+def describe_action(
+    action_name: str, llm_label: str, exclude_from_prompt: bool
+) -> Optional[str]:
+    """
+    Generate a description of the action for use in prompts.
+
+    Parameters
+    ----------
+    action_name : str
+        The name of the action.
+    llm_label : str
+        The label used by the LLM for this action.
+    exclude_from_prompt : bool
+        Whether to exclude this action from the prompt. If True, returns None.
+
+    Returns
+    -------
+    Optional[str]
+        A formatted description of the action, or None if excluded.
+    """
+    if exclude_from_prompt:
+        return None
+
+    return _render_description(action_name, llm_label)
+
+
 def load_action(
     action_config: T.Dict[str, T.Union[str, T.Dict[str, str]]],
 ) -> AgentAction:
@@ -84,31 +188,17 @@ def load_action(
     AgentAction
         An instance of AgentAction with the specified interface and connector.
     """
-    interface = None
-    action = importlib.import_module(f"actions.{action_config['name']}.interface")
-
-    for _, obj in action.__dict__.items():
-        if isinstance(obj, type) and issubclass(obj, Interface) and obj != Interface:
-            interface = obj
-
+    interface = _cached_import(f"actions.{action_config['name']}.interface", Interface)
     if interface is None:
         raise ValueError(f"No interface found for action {action_config['name']}")
 
-    connector = importlib.import_module(
+    connector_module = (
         f"actions.{action_config['name']}.connector.{action_config['connector']}"
     )
-
-    connector_class = None
-    config_class = None
-    for _, obj in connector.__dict__.items():
-        if isinstance(obj, type) and issubclass(obj, ActionConnector):
-            connector_class = obj
-        if (
-            isinstance(obj, type)
-            and issubclass(obj, ActionConfig)
-            and obj != ActionConfig
-        ):
-            config_class = obj
+    connector_class: T.Optional[T.Type[ActionConnector]] = _cached_import(
+        connector_module, ActionConnector
+    )
+    config_class = _cached_import(connector_module, ActionConfig)
 
     if connector_class is None:
         raise ValueError(
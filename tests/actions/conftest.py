@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+from enum import Enum
+from types import SimpleNamespace
+from typing import NamedTuple
+
+import pytest
+
+from actions.base import ActionConfig, ActionConnector, Interface
+
+
+class SampleEnum(str, Enum):
+    OPTION_A = "option a"
+    OPTION_B = "option b"
+
+
+@dataclass
+class EnumInput:
+    action: SampleEnum
+
+
+@dataclass
+class EnumOutput:
+    action: SampleEnum
+
+
+@dataclass
+class EnumInterface(Interface[EnumInput, EnumOutput]):
+    """
+    Sample action with enum values.
+    """
+
+    input: EnumInput
+    output: EnumOutput
+
+
+class StringInput(NamedTuple):
+    action: str
+
+
+class StringOutput(NamedTuple):
+    action: str
+
+
+@dataclass
+class StringInterface(Interface[StringInput, StringOutput]):
+    """
+    Sample action with a string value.
+    """
+
+    input: StringInput
+    output: StringOutput
+
+
+class MockConfig(ActionConfig):
+    timeout: int = 5
+
+
+class MockConnector(ActionConnector[ActionConfig, EnumOutput]):
+    async def connect(self, output_interface: EnumOutput) -> None:
+        pass
+
+
+def _make_interface_module(interface_cls):
+    if interface_cls is None:
+        return SimpleNamespace()
+    return SimpleNamespace(**{interface_cls.__name__: interface_cls})
+
+
+def _make_connector_module(connector_cls, config_cls=None):
+    return SimpleNamespace(
+        **{cls.__name__: cls for cls in (connector_cls, config_cls) if cls is not None}
+    )
+
+
+_INTERFACES = {
+    "enum": EnumInterface,
+    "string": StringInterface,
+    "empty": None,
+}
+
+_CONNECTORS = {
+    "mock": (MockConnector, None),
+    "mock_config": (MockConnector, MockConfig),
+    "empty": (None, None),
+    "missing": None,
+}
+
+
+@pytest.fixture(scope="session")
+def interface_module(request):
+    """Fake `actions.sample.interface` module, selected by indirect param."""
+    return _make_interface_module(_INTERFACES[getattr(request, "param", "enum")])
+
+
+@pytest.fixture(scope="session")
+def connector_module(request):
+    """Fake `actions.sample.connector.mock` module, selected by indirect param."""
+    classes = _CONNECTORS[getattr(request, "param", "mock")]
+    return None if classes is None else _make_connector_module(*classes)
+
+
+@pytest.fixture
+def fake_action_imports(monkeypatch, interface_module, connector_module):
+    """
+    Serve the fake action modules in place of real imports.
+
+    Stubs `actions._spec_exists` to find only the fake modules, and
+    `actions._import` to return them. Returns the list of module names
+    imported so far.
+    """
+    modules = {
+        name: module
+        for name, module in (
+            ("actions.sample.interface", interface_module),
+            ("actions.sample.connector.mock", connector_module),
+        )
+        if module is not None
+    }
+    imported = []
+
+    def fake_import(name):
+        imported.append(name)
+        return modules[name]
+
+    monkeypatch.setattr("actions._spec_exists", modules.__contains__)
+    monkeypatch.setattr("actions._import", fake_import)
+    return imported
@@ -0,0 +1,168 @@
+import re
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+
+from actions import (
+    _render_description,
+    _resolve_class,
+    _spec_exists,
+    describe_action,
+    load_action,
+)
+from actions.base import ActionConfig, AgentAction
+
+_CONNECTOR_RE = re.compile("connector")
+_INTERFACE_RE = re.compile("interface")
+
+_BASE_CFG: MappingProxyType[str, Any] = MappingProxyType(
+    {"name": "sample", "llm_label": "label", "connector": "mock"}
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_import_cache():
+    caches = (_resolve_class, _spec_exists, _render_description)
+    for cache in caches:
+        cache.cache_clear()
+    yield
+    for cache in caches:
+        cache.cache_clear()
+
+
+class TestDescribeAction:
+    def test_describe_action_enum_field(self, fake_action_imports):
+        description = describe_action("sample", "sample_label", False)
+
+        assert description is not None
+        assert description.startswith("SAMPLE_LABEL: ")
+        assert "Sample action with enum values." in description
+        assert "type=sample_label" in description
+        assert "'option a'" in description
+        assert "'option b'" in description
+
+    @pytest.mark.parametrize("interface_module", ["string"], indirect=True)
+    def test_describe_action_string_field(self, fake_action_imports):
+        description = describe_action("sample", "sample_label", False)
+
+        assert description is not None
+        assert "Sample action with a string value." in description
+        assert "value=<class 'str'>" in description
+
+    def test_describe_action_excluded(self, fake_action_imports):
+        assert describe_action("sample", "sample_label", True) is None
+        assert fake_action_imports == []
+
+    @pytest.mark.parametrize("interface_module", ["empty"], indirect=True)
+    def test_describe_action_no_interface_raises(self, fake_action_imports):
+        with pytest.raises(ValueError, match=_INTERFACE_RE):
+            describe_action("sample", "sample_label", False)
+
+    def test_describe_action_imports_once(self, fake_action_imports):
+        first = describe_action("sample", "sample_label", False)
+        second = describe_action("sample", "sample_label", False)
+
+        assert first is second
+        assert fake_action_imports == ["actions.sample.interface"]
+
+    def test_describe_action_renders_once(self, fake_action_imports, monkeypatch):
+        first = describe_action("sample", "sample_label", False)
+        monkeypatch.setattr("actions._cached_import", lambda *args: None)
+
+        assert describe_action("sample", "sample_label", False) == first
+
+
+class TestLoadAction:
+    def test_load_action_success(
+        self, fake_action_imports, interface_module, connector_module
+    ):
+        action = load_action(dict(_BASE_CFG))
+
+        assert isinstance(action, AgentAction)
+        assert action.interface is interface_module.EnumInterface
+        assert isinstance(action.connector, connector_module.MockConnector)
+        assert type(action.connector.config) is ActionConfig
+
+    @pytest.mark.parametrize(
+        "cfg_override, expected_attr, expected_value",
+        [
+            ({}, "name", "sample"),
+            ({}, "llm_label", "label"),
+            ({"llm_label": "custom_label"}, "llm_label", "custom_label"),
+            ({}, "exclude_from_prompt", False),
+            ({"exclude_from_prompt": True}, "exclude_from_prompt", True),
+        ],
+    )
+    def test_load_action_attributes(
+        self, fake_action_imports, cfg_override, expected_attr, expected_value
+    ):
+        action = load_action({**_BASE_CFG, **cfg_override})
+
+        assert getattr(action, expected_attr) == expected_value
+
+    @pytest.mark.parametrize("connector_module", ["mock_config"], indirect=True)
+    def test_load_action_with_custom_config(
+        self, fake_action_imports, connector_module
+    ):
+        config: dict[str, Any] = {**_BASE_CFG, "config": {"timeout": 10}}
+        action = load_action(config)
+
+        assert isinstance(action.connector.config, connector_module.MockConfig)
+        assert action.connector.config.timeout == 10
+
+    def test_load_action_imports_once(self, fake_action_imports):
+        config = dict(_BASE_CFG)
+        first = load_action(config)
+        calls = len(fake_action_imports)
+        second = load_action(config)
+
+        assert len(fake_action_imports) == calls
+        assert first.connector is not second.connector
+
+    @pytest.mark.parametrize("connector_module", ["empty"], indirect=True)
+    def test_load_action_no_connector_raises(self, fake_action_imports):
+        with pytest.raises(ValueError, match=_CONNECTOR_RE):
+            load_action(dict(_BASE_CFG))
+
+    @pytest.mark.parametrize("interface_module", ["empty"], indirect=True)
+    def test_load_action_no_interface_raises(self, fake_action_imports):
+        with pytest.raises(ValueError, match=_INTERFACE_RE):
+            load_action(dict(_BASE_CFG))
+
+    @pytest.mark.parametrize("connector_module", ["missing"], indirect=True)
+    def test_load_action_missing_connector_module_raises(self, fake_action_imports):
+        with pytest.raises(ValueError, match=_CONNECTOR_RE):
+            load_action(dict(_BASE_CFG))
+
+        assert fake_action_imports == ["actions.sample.interface"]
+
+
+def test_spec_exists_caches_missing_modules(monkeypatch):
+    lookups = []
+
+    def find_spec(name):
+        lookups.append(name)
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    monkeypatch.setattr("importlib.util.find_spec", find_spec)
+
+    assert _spec_exists("actions.missing.interface") is False
+    assert _spec_exists("actions.missing.interface") is False
+    assert lookups == ["actions.missing.interface"]
+
+
+def test_spec_exists_real_modules():
+    assert _spec_exists("actions.move.interface") is True
+    assert _spec_exists("actions.move.connector.missing") is False
+    assert _spec_exists("actions.missing.interface") is False
+
+
+def test_spec_exists_broken_parent_raises(tmp_path, monkeypatch):
+    package = tmp_path / "broken_action"
+    package.mkdir()
+    (package / "__init__.py").write_text("import missing_dependency\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    with pytest.raises(ModuleNotFoundError, match="missing_dependency"):
+        _spec_exists("broken_action.interface")